@@ -4,9 +4,13 @@ Provides the main user interface controls for screen capture functionality.
 """
 
 # pylint: disable=no-member
+import logging
+
 from PyQt5 import QtWidgets, QtCore
 from overlay import Overlay
 
+logger = logging.getLogger(__name__)
+
 VERSION = 0.25
 
 class ControlWindow(QtWidgets.QWidget):
@@ -21,6 +25,9 @@ class ControlWindow(QtWidgets.QWidget):
         super().__init__()
         self.overlay = None  # Initialize with no overlay
         self.init_ui()
+        # Build the overlay once the event loop is idle so the first
+        # activation doesn't pay for screen enumeration and window setup
+        QtCore.QTimer.singleShot(0, self._preinit_overlay)
 
     def init_ui(self):
         """Initialize and setup the user interface components."""
@@ -46,18 +53,20 @@ class ControlWindow(QtWidgets.QWidget):
             button.clicked.connect(callback)
             layout.addWidget(button)
 
-    def show_overlays(self):
-        """Show the overlay for screen capture selection."""
+    def _preinit_overlay(self):
+        """Create the overlay ahead of time without showing it."""
         if not self.overlay:
             self.overlay = Overlay(control_window=self)
-            self.overlay.show()
-            print("Overlay initialized to span all monitors")
-        else:
-            self.overlay.show()
+            logger.debug("Overlay initialized to span all monitors")
+
+    def show_overlays(self):
+        """Show the overlay for screen capture selection."""
+        self._preinit_overlay()
+        self.overlay.show()
 
     def toggle_overlay_lock(self):
         """Toggle the locked state of the overlay."""
-        if self.overlay:
+        if self.overlay and self.overlay.isVisible():
             self.overlay.toggle_lock()
 
     def trigger_capture(self):
@@ -65,4 +74,4 @@ class ControlWindow(QtWidgets.QWidget):
         if self.overlay and self.overlay.selection_finalized:
             self.overlay.capture_screen()
         else:
-            print("No valid selection or overlay not created")
+            logger.warning("No valid selection or overlay not created")
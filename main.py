@@ -16,6 +16,7 @@ TODO:
 """
 
 import sys
+import logging
 from PyQt5 import QtWidgets, QtGui
 from control_window import ControlWindow
 
@@ -33,21 +34,16 @@ def setup_shortcuts(window):
         - Ctrl+Q: Quit application
     """
     # Define shortcuts
-    QtWidgets.QShortcut(
-        QtGui.QKeySequence("Ctrl+Shift+S"), window, activated=window.show_overlays
-    )
-    QtWidgets.QShortcut(
-        QtGui.QKeySequence("Pause"), window, activated=window.trigger_capture
-    )
-    QtWidgets.QShortcut(
-        QtGui.QKeySequence("Ctrl+P"), window, activated=window.trigger_capture
-    )
-    QtWidgets.QShortcut(
-        QtGui.QKeySequence("Ctrl+L"), window, activated=window.toggle_overlay_lock
-    )
-    QtWidgets.QShortcut(
-        QtGui.QKeySequence("Ctrl+Q"), window, activated=QtWidgets.QApplication.quit
-    )
+    shortcuts = [
+        ("Ctrl+Shift+S", window.show_overlays),
+        ("Pause", window.trigger_capture),
+        ("Ctrl+P", window.trigger_capture),
+        ("Ctrl+L", window.toggle_overlay_lock),
+        ("Ctrl+Q", QtWidgets.QApplication.quit)
+    ]
+
+    for sequence, callback in shortcuts:
+        QtWidgets.QShortcut(QtGui.QKeySequence(sequence), window, activated=callback)
 
 def main():
     """
@@ -59,6 +55,7 @@ def main():
     Returns:
         int: Application exit code
     """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     app = QtWidgets.QApplication(sys.argv)
     control_window = ControlWindow()
     setup_shortcuts(control_window)
@@ -17,11 +17,63 @@ Remember:  Qt uses camelCase, pep8 uses snake_case.
 """
 
 import re
+import logging
 import platform
 import datetime
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+logger = logging.getLogger(__name__)
+
+# Session name sanitizing patterns, compiled once at import
+_SANITIZE_BAD = re.compile(r"[^A-Za-z0-9\-.]")
+_SANITIZE_DASHES = re.compile(r"-+")
+
+# Platform check and Qt enum values used by the overlay, resolved once at import
+_IS_WINDOWS = platform.system() == "Windows"
+_WA_TB = QtCore.Qt.WA_TranslucentBackground
+_WA_NSB = QtCore.Qt.WA_NoSystemBackground
+_WA_TFME = QtCore.Qt.WA_TransparentForMouseEvents
+_WT_FOR_INPUT = QtCore.Qt.WindowTransparentForInput
+_BASE_FLAGS = (
+    QtCore.Qt.WindowStaysOnTopHint
+    | QtCore.Qt.FramelessWindowHint
+    | QtCore.Qt.Tool
+)
+
+
+class _SaveTask(QtCore.QRunnable):
+    """
+    Background task that encodes and writes a captured image to disk.
+
+    PNG compression is CPU-bound, so it runs on the overlay's save pool instead
+    of blocking the GUI thread. Works on a QImage, which unlike QPixmap is safe
+    to use outside the GUI thread.
+
+    Attributes:
+        image (QImage): The captured image to save
+        filename (str): Destination path of the PNG file
+    """
+
+    def __init__(self, image, filename):
+        """
+        Initialize the save task.
+
+        Args:
+            image (QImage): The captured image to save
+            filename (str): Destination path of the PNG file
+        """
+        super().__init__()
+        self.image = image
+        self.filename = filename
+
+    def run(self):
+        """Save the image as PNG, logging the outcome."""
+        if self.image.save(self.filename, "PNG"):
+            logger.info("Saved as %s", self.filename)
+        else:
+            logger.error("Error during capture: failed to save %s", self.filename)
+
 
 class Overlay(QtWidgets.QWidget):
     """
@@ -58,8 +110,11 @@ class Overlay(QtWidgets.QWidget):
         self.selection_finalized = False
         self.begin = QtCore.QPoint(0, 0)
         self.end = QtCore.QPoint(0, 0)
+        self._sel_rect = QtCore.QRect()  # Normalized begin/end, updated with them
         self.control_window = control_window
         self.session_name = None
+        self._total_geometry = None
+        self._capture_in_flight = False
         self.init_ui()
 
     def init_ui(self):
@@ -70,37 +125,122 @@ class Overlay(QtWidgets.QWidget):
         overlay that spans all available monitors. Configures window properties
         for proper display on different operating systems.
         """
-        self.base_flags = (
-            QtCore.Qt.WindowStaysOnTopHint
-            | QtCore.Qt.FramelessWindowHint
-            | QtCore.Qt.Tool
-        )
+        self.base_flags = _BASE_FLAGS
         self.setWindowFlags(self.base_flags)
-        if platform.system() == "Windows":
-            self.setAttribute(QtCore.Qt.WA_TranslucentBackground, True)
-            self.setAttribute(QtCore.Qt.WA_NoSystemBackground, False)
+        self._current_flags = self.base_flags
+        if _IS_WINDOWS:
+            self.setAttribute(_WA_TB, True)
+            self.setAttribute(_WA_NSB, False)
         else:
-            self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
-            self.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)
+            self.setAttribute(_WA_TB)
+            self.setAttribute(_WA_NSB, True)
 
         # Get the QScreen objects for all monitors
         screens = QtWidgets.QApplication.screens()
 
-        # Find the bounding rectangle that contains all screens
-        min_x = min(screen.geometry().left() for screen in screens)
-        min_y = min(screen.geometry().top() for screen in screens)
-        max_x = max(screen.geometry().right() for screen in screens)
-        max_y = max(screen.geometry().bottom() for screen in screens)
-
         # Create a rectangle that spans all monitors
-        total_geometry = QtCore.QRect(min_x, min_y, max_x - min_x, max_y - min_y)
+        total_geometry = self.total_geometry()
 
         self.setGeometry(total_geometry)
+        # Widget-to-global offset, kept current by moveEvent
+        self._global_origin = total_geometry.topLeft()
         self.setWindowOpacity(0.3)
-        print(f"Overlay initialized with geometry: {total_geometry}")
-        print(f"Number of screens detected: {len(screens)}")
-        for i, screen in enumerate(screens):
-            print(f"Screen {i} geometry: {screen.geometry()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Overlay initialized with geometry: %s", total_geometry)
+            logger.debug("Number of screens detected: %d", len(screens))
+            for i, screen in enumerate(screens):
+                logger.debug("Screen %d geometry: %s", i, screen.geometry())
+
+        # Coalesce mouse-move repaints to ~60 Hz regardless of mouse polling rate,
+        # accumulating only the area the selection has touched since the last frame
+        self._dirty_rect = QtCore.QRect()
+        self._repaint_timer = QtCore.QTimer(self)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
+
+        # Single worker for saving captures, so writes to a file name reused
+        # within the same second run one after another (last one wins)
+        self._save_pool = QtCore.QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
+        # Painting resources reused by every paintEvent
+        self._bg_brush = QtGui.QBrush(QtGui.QColor(0, 0, 0, 51))  # lower is more transparent
+        self._pen_locked = QtGui.QPen(QtGui.QColor(0, 255, 0), 5)  # Green border for locked
+        self._pen_active = QtGui.QPen(QtGui.QColor(255, 0, 0), 5)  # Red border for active
+
+        # Recompute the spanned area only when the monitor layout changes
+        app = QtWidgets.QApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._on_screens_changed)
+        for screen in screens:
+            screen.virtualGeometryChanged.connect(self._on_screens_changed)
+
+    def total_geometry(self):
+        """
+        Return the bounding rectangle of all monitors.
+
+        The result is cached until a screen is added or removed, or the
+        virtual desktop geometry changes.
+
+        Returns:
+            QRect: Rectangle spanning the whole virtual desktop
+        """
+        if self._total_geometry is None:
+            screens = QtWidgets.QApplication.screens()
+            total = screens[0].geometry()
+            for screen in screens[1:]:
+                total = total.united(screen.geometry())
+            self._total_geometry = total
+        return self._total_geometry
+
+    def _on_screen_added(self, screen):
+        """
+        Track geometry changes of a newly added screen and refit the overlay.
+
+        Args:
+            screen (QScreen): The screen that was added
+        """
+        screen.virtualGeometryChanged.connect(self._on_screens_changed)
+        self._on_screens_changed()
+
+    def _on_screens_changed(self, *_args):
+        """
+        Invalidate the cached desktop geometry and resize the overlay to match.
+
+        The selection is stored in widget coordinates, so it is shifted by the
+        change in origin to keep it on the same desktop area, and the lock
+        mask is rebuilt for the new widget size.
+
+        Args:
+            *_args: The screen or geometry passed by the signal, unused
+        """
+        old_origin = self._global_origin
+        self._total_geometry = None
+        total_geometry = self.total_geometry()
+        if total_geometry == self.geometry():
+            return
+
+        self.setGeometry(total_geometry)
+        self._global_origin = total_geometry.topLeft()
+        offset = old_origin - self._global_origin
+        self.begin = self.begin + offset
+        self.end = self.end + offset
+        self._sel_rect = self._sel_rect.translated(offset)
+        if self.locked:
+            self.updateLockState()
+        self.update()
+
+    def _flush_repaint(self):
+        """
+        Repaint the area accumulated by mouse moves since the last frame.
+
+        Called by the repaint timer; limits the paint event to the union of the
+        old and new selection rectangles instead of the whole virtual desktop.
+        """
+        if not self._dirty_rect.isNull():
+            self.update(self._dirty_rect)
+            self._dirty_rect = QtCore.QRect()
 
     def sanitize_session_name(self, name):
         """
@@ -116,16 +256,16 @@ class Overlay(QtWidgets.QWidget):
             return None
 
         # Remove any characters that aren't alphanumeric, dash, or dot
-        sanitized = re.sub(r"[^A-Za-z0-9\-\.]", "-", name)
+        sanitized = _SANITIZE_BAD.sub("-", name)
 
         # Replace multiple consecutive dashes with a single dash
-        sanitized = re.sub(r"-+", "-", sanitized)
+        sanitized = _SANITIZE_DASHES.sub("-", sanitized)
 
         # Remove leading/trailing dashes and dots
         sanitized = sanitized.strip("-.")
 
         # Check if the name is just dots or empty after sanitization
-        if not sanitized or all(c == "." for c in sanitized):
+        if not sanitized.replace(".", ""):
             return None
 
         return sanitized
@@ -134,9 +274,12 @@ class Overlay(QtWidgets.QWidget):
         """
         Prompt user for session name and store it.
 
+        Hands focus back to the control window once the dialog closes.
+
         Returns:
             bool: True if valid name provided, False if cancelled
         """
+        accepted = True
         while self.session_name is None:
             name, ok = QtWidgets.QInputDialog.getText(
                 self,
@@ -145,8 +288,9 @@ class Overlay(QtWidgets.QWidget):
             )
             if not ok:
                 self.selection_finalized = False
-                print("Selection cancelled - no session name provided")
-                return False
+                logger.info("Selection cancelled - no session name provided")
+                accepted = False
+                break
 
             self.session_name = self.sanitize_session_name(name)
             if self.session_name is None:
@@ -155,7 +299,11 @@ class Overlay(QtWidgets.QWidget):
                     "Invalid Name",
                     "Please use only letters, numbers, dash (-) and dot (.). Name cannot be empty or just dots.",
                 )
-        return True
+
+        if self.control_window:
+            self.control_window.activateWindow()
+            self.control_window.raise_()
+        return accepted
 
     def toggle_lock(self):
         """
@@ -172,34 +320,37 @@ class Overlay(QtWidgets.QWidget):
         if not self.locked and self.control_window:
             self.control_window.activateWindow()
             self.control_window.raise_()
-        print(f"Selection {'locked' if self.locked else 'unlocked'}.")
+        logger.info("Selection %s.", "locked" if self.locked else "unlocked")
 
     def perform_capture(self):
         """
         Prepare and initiate the screen capture process.
 
         Calculates global screen coordinates and initiates the capture
-        if selection is valid and session name is set.
+        if selection is valid and session name is set. Requests made while a
+        capture is already in progress are ignored.
         """
-        print("Starting capture process...")
-        begin_global = self.mapToGlobal(self.begin)
-        end_global = self.mapToGlobal(self.end)
+        if self._capture_in_flight:
+            # e.g. Pause auto-repeat while the overlay is hidden for a grab
+            logger.debug("Capture already in progress, ignoring request")
+            return
+        logger.debug("Starting capture process...")
+        begin_global = self.begin + self._global_origin
+        end_global = self.end + self._global_origin
 
         # Calculate global screen coordinates
-        x1, y1 = min(begin_global.x(), end_global.x()), min(
-            begin_global.y(), end_global.y()
-        )
-        x2, y2 = max(begin_global.x(), end_global.x()), max(
-            begin_global.y(), end_global.y()
-        )
-        width, height = x2 - x1, y2 - y1
+        rect = QtCore.QRect(begin_global, end_global).normalized()
+        x1, y1, width, height = rect.x(), rect.y(), rect.width(), rect.height()
 
-        print(
-            f"Selection coordinates - Begin: ({begin_global.x()}, {begin_global.y()}), End: ({end_global.x()}, {end_global.y()})"
-        )
-        print(f"Calculated region: ({x1}, {y1}, {width}, {height})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Selection coordinates - Begin: (%d, %d), End: (%d, %d)",
+                begin_global.x(), begin_global.y(), end_global.x(), end_global.y(),
+            )
+            logger.debug("Calculated region: (%d, %d, %d, %d)", x1, y1, width, height)
 
-        if width > 0 and height > 0 and self.session_name:
+        if width > 1 and height > 1 and self.session_name:
+            self._capture_in_flight = True
             self.hide()  # Hide overlay for capture
             # Add small delay to ensure overlay is fully hidden and capture variables
             captured_coords = (x1, y1, width, height)  # Capture variables for lambda
@@ -213,8 +364,20 @@ class Overlay(QtWidgets.QWidget):
                 msg = "No valid capture area selected. Please make a selection before capturing."
 
             QtWidgets.QMessageBox.warning(self, "Capture Error", msg)
-            print("Invalid capture parameters")
+            logger.warning("Invalid capture parameters")
 
+    def moveEvent(self, event):
+        """
+        Handle the overlay being moved.
+
+        Args:
+            event (QMoveEvent): The move event
+
+        Keeps the cached global origin in sync if the window manager
+        repositions the overlay.
+        """
+        super().moveEvent(event)
+        self._global_origin = self.geometry().topLeft()
 
     def do_capture(self, x1, y1, width, height):
         """
@@ -226,34 +389,50 @@ class Overlay(QtWidgets.QWidget):
             width (int): Width of the capture area
             height (int): Height of the capture area
 
-        Creates a screenshot of the specified region and saves it as a PNG file
-        with timestamp in the filename. Shows error message if capture fails.
+        Creates a screenshot of the specified region from the screen containing
+        its center and saves it as a PNG file with timestamp in the filename.
+        Encoding and writing happen on a worker thread so the overlay reappears
+        without waiting on the file. Shows error message if capture fails.
         """
-        print(
-            f"DEBUG: Starting capture with coordinates: x={x1}, y={y1}, width={width}, height={height}"
+        logger.debug(
+            "Starting capture with coordinates: x=%d, y=%d, width=%d, height=%d",
+            x1, y1, width, height,
         )
         try:
-            print(
-                f"Starting capture with coordinates: x={x1}, y={y1}, width={width}, height={height}"
+            # Grab from the screen containing the selection center, using
+            # coordinates local to that screen
+            center = QtCore.QPoint(x1 + width // 2, y1 + height // 2)
+            screen = (
+                QtGui.QGuiApplication.screenAt(center)
+                or QtWidgets.QApplication.primaryScreen()
             )
-
-            # Create a pixmap to hold the screenshot
-            screen = QtWidgets.QApplication.primaryScreen()
-            screenshot = screen.grabWindow(0, x1, y1, width, height)
+            geo = screen.geometry()
+            # grabWindow takes logical coordinates; on HiDPI screens the pixmap
+            # comes back at physical resolution with devicePixelRatio > 1
+            screenshot = screen.grabWindow(0, x1 - geo.x(), y1 - geo.y(), width, height)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Grabbed %dx%d px from %s (devicePixelRatio=%s)",
+                    screenshot.width(), screenshot.height(), screen.name(),
+                    screen.devicePixelRatio(),
+                )
 
             # Save the screenshot with session name
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             filename = f"{self.session_name}-{timestamp}.png"
-            screenshot.save(filename, "PNG")
-            print(f"Captured at {timestamp} - Saved as {filename}")
+            image = screenshot.toImage()
+            image.setText("Software", "screendocs")
+            self._save_pool.start(_SaveTask(image, filename))
+            logger.debug("Captured at %s - Saving as %s", timestamp, filename)
 
         except Exception as e:
-            print(f"Error during capture: {str(e)}")
+            logger.error("Error during capture: %s", e)
             QtWidgets.QMessageBox.warning(
                 self, "Capture Error", f"Failed to capture screenshot: {str(e)}"
             )
         finally:
             self.show()  # Always show overlay after capture attempt
+            self._capture_in_flight = False
 
     def capture_screen(self):
         """
@@ -263,10 +442,10 @@ class Overlay(QtWidgets.QWidget):
         If selection is not finalized, logs an error message.
         """
         if self.selection_finalized:
-            print("Attempting to capture...")
+            logger.debug("Attempting to capture...")
             self.perform_capture()
         else:
-            print("No valid selection finalized, cannot capture.")
+            logger.warning("No valid selection finalized, cannot capture.")
 
     def updateLockState(self):
         """
@@ -280,26 +459,59 @@ class Overlay(QtWidgets.QWidget):
             - Returns to normal opacity
             - Clears masks
             - Enables interaction for new selections
+
+        Window flags are only reassigned when they actually change, since
+        setWindowFlags recreates the native window.
         """
         if self.locked:
             self.setWindowOpacity(0.4)  # More visible when locked
             # Only make the selection area transparent to mouse events
-            selection_rect = QtCore.QRect(self.begin, self.end).normalized()
-            region = QtGui.QRegion(self.rect())
-            region = region.subtracted(QtGui.QRegion(selection_rect))
-            self.setMask(region)
+            self.setMask(self.border_region(self._sel_rect))
             # Allow mouse events to pass through the overlay except in selection area
-            self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
-            self.setWindowFlags(self.base_flags | QtCore.Qt.WindowTransparentForInput)
+            self.setAttribute(_WA_TFME, True)
+            new_flags = self.base_flags | _WT_FOR_INPUT
         else:
             self.setWindowOpacity(0.4)  # Normal visibility when unlocked
             # Clear any mask when unlocked
             self.clearMask()
             # Allow interaction for making new selections
-            self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, False)
-            self.setWindowFlags(self.base_flags)
+            self.setAttribute(_WA_TFME, False)
+            new_flags = self.base_flags
+        if new_flags != self._current_flags:
+            self.setWindowFlags(new_flags)
+            self._current_flags = new_flags
         self.show()
 
+    def border_region(self, selection_rect):
+        """
+        Build the widget area outside the selection as at most four strips.
+
+        Equivalent to subtracting the selection from the full widget region,
+        but without QRegion band-merging across the whole virtual desktop.
+
+        Args:
+            selection_rect (QRect): The normalized selection rectangle
+
+        Returns:
+            QRegion: The widget area excluding the selection
+        """
+        r = self.rect()
+        s = selection_rect.intersected(r)
+        if s.isEmpty():
+            return QtGui.QRegion(r)
+
+        strips = (
+            QtCore.QRect(r.left(), r.top(), r.width(), s.top() - r.top()),  # top
+            QtCore.QRect(r.left(), s.bottom() + 1, r.width(), r.bottom() - s.bottom()),  # bottom
+            QtCore.QRect(r.left(), s.top(), s.left() - r.left(), s.height()),  # left
+            QtCore.QRect(s.right() + 1, s.top(), r.right() - s.right(), s.height()),  # right
+        )
+        region = QtGui.QRegion()
+        for strip in strips:
+            if strip.isValid():
+                region = region.united(QtGui.QRegion(strip))
+        return region
+
     def paintEvent(self, event):
         """
         Handle the painting of the overlay window.
@@ -309,23 +521,27 @@ class Overlay(QtWidgets.QWidget):
 
         Draws the semi-transparent background and the selection rectangle with
         appropriate border color based on lock state (green for locked, red for active).
+        Only the background is drawn while there is no selection to show.
         """
         super().paintEvent(event)
         qp = QtGui.QPainter(self)
-        qp.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        # Only touch the pixels Qt asked us to repaint
+        qp.setClipRect(event.rect())
 
         # Entire widget size
         rect = self.rect()
 
         # Drawing the semi-transparent background
-        qp.setBrush(
-            QtGui.QBrush(QtGui.QColor(0, 0, 0, 51))
-        )  # set opacity level, lower is more transparent
+        qp.setBrush(self._bg_brush)
         qp.setPen(QtCore.Qt.NoPen)
         qp.drawRect(rect)
 
-        # Define the selected area rectangle from begin to end points
-        selection_rect = QtCore.QRect(self.begin, self.end).normalized()
+        # Selected area rectangle, kept current by the mouse handlers
+        selection_rect = self._sel_rect
+
+        # Nothing selected yet, skip the clear and border passes
+        if selection_rect.width() <= 1 or selection_rect.height() <= 1:
+            return
 
         # Clear the selected area to make it fully transparent
         qp.setCompositionMode(QtGui.QPainter.CompositionMode_Clear)
@@ -333,10 +549,7 @@ class Overlay(QtWidgets.QWidget):
 
         # Redraw the border around the selected area
         qp.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
-        if self.locked:
-            qp.setPen(QtGui.QPen(QtGui.QColor(0, 255, 0), 5))  # Green border for locked
-        else:
-            qp.setPen(QtGui.QPen(QtGui.QColor(255, 0, 0), 5))  # Red border for active
+        qp.setPen(self._pen_locked if self.locked else self._pen_active)
         qp.setBrush(QtCore.Qt.NoBrush)
         qp.drawRect(selection_rect)
 
@@ -355,6 +568,7 @@ class Overlay(QtWidgets.QWidget):
         self.selection_finalized = False  # Reset selection finalized on new press
         self.begin = event.pos()
         self.end = self.begin
+        self._sel_rect = QtCore.QRect(self.begin, self.end).normalized()
         # Set focus during mouse selection
         self.activateWindow()
         self.setFocus(QtCore.Qt.MouseFocusReason)
@@ -368,12 +582,20 @@ class Overlay(QtWidgets.QWidget):
             event (QMouseEvent): The mouse move event
 
         Updates the end point of the selection area as the mouse moves,
-        but only if selection is currently active.
+        but only if selection is currently active. Repaints are throttled
+        through a single-shot timer so high polling-rate mice don't flood
+        the overlay with full-screen paint events.
         """
         super().mouseMoveEvent(event)
         if self.is_active:
+            # Old and new selection plus a margin for the 5px border
+            old_rect = self._sel_rect
             self.end = event.pos()
-            self.update()
+            self._sel_rect = QtCore.QRect(self.begin, self.end).normalized()
+            dirty = old_rect.united(self._sel_rect).adjusted(-6, -6, 6, 6)
+            self._dirty_rect = self._dirty_rect.united(dirty)
+            if not self._repaint_timer.isActive():
+                self._repaint_timer.start()
 
     def mouseReleaseEvent(self, event):
         """
@@ -387,16 +609,16 @@ class Overlay(QtWidgets.QWidget):
         super().mouseReleaseEvent(event)
         if self.is_active:
             self.is_active = False
+            self._repaint_timer.stop()
+            self._dirty_rect = QtCore.QRect()
+            self.end = event.pos()
+            self._sel_rect = QtCore.QRect(self.begin, self.end).normalized()
             self.selection_finalized = True
-            self.capture_area = (self.begin, self.end)
 
             if not self.locked:
-                self.prompt_session_name()
-
-            if not self.locked and self.control_window:
-                self.control_window.activateWindow()
-                self.control_window.raise_()
+                # Let the release event return before the modal dialog runs
+                QtCore.QTimer.singleShot(0, self.prompt_session_name)
 
             self.clearFocus()
             self.update()
-            print(f"Mouse released at {self.end}, capture area set.")
+            logger.debug("Mouse released at %s, capture area set.", self.end)